@@ -2,6 +2,7 @@
 Main entrypoint when MQTT IO is invoked as `python -m mqtt_io`.
 """
 import argparse
+import asyncio
 import logging.config
 import sys
 from copy import deepcopy
@@ -102,6 +103,14 @@ def main() -> None:
         sentry_sdk.set_context("config", redact_config(config))
         if issue_id is not None:
             sentry_sdk.set_tag("issue_id", issue_id)
+
+    try:
+        import uvloop  # type: ignore  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        _LOG.debug("uvloop not installed. Using the default asyncio event loop.")
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         mqtt_gpio = MqttIo(config)
         mqtt_gpio.run()
@@ -6,7 +6,7 @@ import asyncio
 import logging
 from abc import ABC
 from dataclasses import dataclass
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Type
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Type
 
 from .utils import create_unawaited_task_threadsafe
 
@@ -83,7 +83,7 @@ class EventBus:
     def __init__(
         self,
         loop: asyncio.AbstractEventLoop,
-        transient_tasks: List["asyncio.Task[Any]"],
+        transient_tasks: Set["asyncio.Task[Any]"],
     ):
         self._loop = loop
         self._transient_tasks = transient_tasks
@@ -136,6 +136,16 @@ class GenericGPIO(abc.ABC):  # pylint: disable=too-many-instance-attributes
         Set an individual pin to the given value.
         """
 
+    def set_pins(self, pin_values: Dict[PinType, bool]) -> None:
+        """
+        Set multiple pins to the given values.
+
+        Modules which are able to set several pins in one operation (such as writing a
+        whole register on an IO expander) should override this.
+        """
+        for pin, value in pin_values.items():
+            self.set_pin(pin, value)
+
     @abc.abstractmethod
     def get_pin(self, pin: PinType) -> bool:
         """
@@ -260,6 +270,13 @@ class GenericGPIO(abc.ABC):  # pylint: disable=too-many-instance-attributes
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(self.executor, self.set_pin, pin, value)
 
+    async def async_set_pins(self, pin_values: Dict[PinType, bool]) -> None:
+        """
+        Use a ThreadPoolExecutor to call the module's synchronous set_pins function.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, self.set_pins, pin_values)
+
     async def async_get_pin(self, pin: PinType) -> bool:
         """
         Use a ThreadPoolExecutor to call the module's synchronous get_pin function.
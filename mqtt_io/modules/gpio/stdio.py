@@ -2,7 +2,7 @@
 GPIO module for writing outputs to the console. Used for testing.
 """
 
-from typing import Optional
+from typing import Dict, Optional
 
 from ...types import ConfigType, PinType
 from . import GenericGPIO, PinDirection, PinPUD
@@ -39,6 +39,9 @@ class GPIO(GenericGPIO):
     def set_pin(self, pin: PinType, value: bool) -> None:
         print("set_pin(pin=%r, value=%r)" % (pin, value))
 
+    async def async_set_pins(self, pin_values: Dict[PinType, bool]) -> None:
+        self.set_pins(pin_values)
+
     async def async_get_pin(self, pin: PinType) -> bool:
         return self.get_pin(pin)
 
@@ -0,0 +1,34 @@
+"""
+Mock Stream module for use with the tests.
+"""
+
+from typing import Optional
+from unittest.mock import Mock
+
+from ...types import ConfigType
+from . import GenericStream
+
+REQUIREMENTS = ()
+CONFIG_SCHEMA = dict(test=dict(type="boolean", required=False, default=False))
+
+
+# pylint: disable=useless-super-delegation
+class Stream(GenericStream):
+    """
+    Mock Stream class for use with the tests.
+    """
+
+    def __init__(self, config: ConfigType):
+        self.setup_module = Mock()  # type: ignore[assignment]
+        self.read = Mock(return_value=None)  # type: ignore[assignment]
+        self.write = Mock()  # type: ignore[assignment]
+        super().__init__(config)
+
+    def setup_module(self) -> None:
+        return super().setup_module()
+
+    def read(self) -> Optional[bytes]:
+        return super().read()
+
+    def write(self, data: bytes) -> None:
+        return super().write(data)
@@ -10,14 +10,25 @@ and setting their values and data, connecting to MQTT and sending/receiving MQTT
 
 import asyncio
 import logging
-import re
 import signal as signals
 import threading
 from asyncio.queues import QueueEmpty
 from functools import partial
 from hashlib import sha1
 from importlib import import_module
-from typing import Any, Dict, List, Optional, Tuple, Type, Union, overload
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
 
 import backoff  # type: ignore
 from typing_extensions import Literal
@@ -70,7 +81,11 @@ from .mqtt import (
     MQTTWill,
 )
 from .types import ConfigType, PinType, SensorValueType
-from .utils import PriorityCoro, create_unawaited_task_threadsafe
+from .utils import (
+    PriorityCoro,
+    add_transient_task,
+    create_unawaited_task_threadsafe,
+)
 
 _LOG = logging.getLogger(__name__)
 
@@ -128,16 +143,6 @@ def _init_module(
     return module_class(module_config)
 
 
-def output_name_from_topic(topic: str, prefix: str, topic_type: str) -> str:
-    """
-    Parses an MQTT topic and returns the name of the output that the message relates to.
-    """
-    match = re.match(f"^{prefix}/{topic_type}/(.+?)/.+$", topic)
-    if match is None:
-        raise ValueError("Topic %r does not adhere to expected structure" % topic)
-    return match.group(1)
-
-
 class MqttIo:  # pylint: disable=too-many-instance-attributes
     """
     The main class that represents the business logic of the server. This is instantiated
@@ -175,10 +180,12 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
             {}
         )  # type: Dict[str, asyncio.Queue[Tuple[ConfigType, str]]]
 
-        self.loop = loop or asyncio.get_event_loop()
+        # Don't use asyncio.get_event_loop() here, as it's deprecated when there's no
+        # running loop. run() makes this the current loop before it starts.
+        self.loop = loop or asyncio.new_event_loop()
         self._main_task: Optional["asyncio.Task[None]"] = None
         self.critical_tasks: List["asyncio.Task[Any]"] = []
-        self.transient_tasks: List["asyncio.Task[Any]"] = []
+        self.transient_tasks: Set["asyncio.Task[Any]"] = set()
 
         self.event_bus = EventBus(self.loop, self.transient_tasks)
         self.mqtt: Optional[AbstractMQTTClient] = None
@@ -187,6 +194,11 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
         self.mqtt_task_queue: "asyncio.PriorityQueue[PriorityCoro]"
         self.mqtt_connected: asyncio.Event
 
+        # Handlers for messages received on each of the topics we subscribe to
+        self._mqtt_topic_handlers: Dict[
+            str, Callable[[bytes], Coroutine[Any, Any, None]]
+        ] = {}
+
         async def create_loop_resources() -> None:
             """
             Create non-threadsafe resources on the loop we're going to use.
@@ -204,6 +216,11 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
         if not client_id:
             client_id = "mqtt-io-%s" % sha1(topic_prefix.encode("utf8")).hexdigest()
 
+        # Encoded once, as they're published on every keepalive
+        self._status_topic = "/".join((topic_prefix, config["status_topic"]))
+        self._status_payload_running = config["status_payload_running"].encode("utf8")
+        self._status_payload_stopped = config["status_payload_stopped"].encode("utf8")
+
         tls_enabled: bool = config.get("tls", {}).get("enabled")
 
         tls_options = None
@@ -225,7 +242,7 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
             clean_session=config["clean_session"],
             tls_options=tls_options,
             will=MQTTWill(
-                topic="/".join((topic_prefix, config["status_topic"])),
+                topic=self._status_topic,
                 payload=config["status_payload_dead"].encode("utf8"),
                 qos=1,
                 retain=True,
@@ -270,13 +287,7 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
                 PriorityCoro(
                     self._mqtt_publish(
                         MQTTMessageSend(
-                            "/".join(
-                                (
-                                    self.config["mqtt"]["topic_prefix"],
-                                    STREAM_TOPIC,
-                                    stream_conf["name"],
-                                )
-                            ),
+                            stream_conf["_publish_topic"],
                             event.data,
                             retain=stream_conf["retain"],
                         )
@@ -295,9 +306,13 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
                 stream_conf, "stream", self.config["options"]["install_requirements"]
             )
             self.stream_modules[stream_conf["name"]] = stream_module
+            stream_conf["_publish_topic"] = "/".join(
+                (self.config["mqtt"]["topic_prefix"], STREAM_TOPIC, stream_conf["name"])
+            )
 
-            self.transient_tasks.append(
-                self.loop.create_task(self.stream_poller(stream_module, stream_conf))
+            add_transient_task(
+                self.transient_tasks,
+                self.loop.create_task(self.stream_poller(stream_module, stream_conf)),
             )
 
             async def create_stream_output_queue(
@@ -312,7 +327,8 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
             self.loop.run_until_complete(create_stream_output_queue())
 
             # Queue a stream output loop task
-            self.transient_tasks.append(
+            add_transient_task(
+                self.transient_tasks,
                 self.loop.create_task(
                     # Use partial to avoid late binding closure
                     partial(
@@ -321,18 +337,14 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
                         stream_conf,
                         self.stream_output_queues[stream_conf["name"]],
                     )()
-                )
+                ),
             )
 
-            sub_topics.append(
-                "/".join(
-                    (
-                        self.config["mqtt"]["topic_prefix"],
-                        STREAM_TOPIC,
-                        stream_conf["name"],
-                        SEND_SUFFIX,
-                    )
-                )
+            sub_topic = "/".join((stream_conf["_publish_topic"], SEND_SUFFIX))
+            sub_topics.append(sub_topic)
+            self._mqtt_topic_handlers[sub_topic] = partial(
+                self._handle_stream_send_msg,
+                self.stream_output_queues[stream_conf["name"]],
             )
 
         # Subscribe to stream send topics
@@ -356,20 +368,12 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
         # Needs to be a function, not a method, hence the closure function.
         async def publish_callback(event: DigitalInputChangedEvent) -> None:
             in_conf = self.digital_input_configs[event.input_name]
-            value = event.to_value != in_conf["inverted"]
-            val = in_conf["on_payload"] if value else in_conf["off_payload"]
             self.mqtt_task_queue.put_nowait(
                 PriorityCoro(
                     self._mqtt_publish(
                         MQTTMessageSend(
-                            "/".join(
-                                (
-                                    self.config["mqtt"]["topic_prefix"],
-                                    INPUT_TOPIC,
-                                    event.input_name,
-                                )
-                            ),
-                            val.encode("utf8"),
+                            in_conf["_publish_topic"],
+                            in_conf["_publish_payloads"][event.to_value],
                             retain=in_conf["retain"],
                         )
                     ),
@@ -382,6 +386,18 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
         for in_conf in self.config["digital_inputs"]:
             gpio_module = self.gpio_modules[in_conf["module"]]
             in_conf = validate_and_normalise_digital_input_config(in_conf, gpio_module)
+            # Precompute what we publish on every change of this input. The payloads are
+            # indexed by the pin's value, with any inversion already applied.
+            in_conf["_publish_topic"] = "/".join(
+                (self.config["mqtt"]["topic_prefix"], INPUT_TOPIC, in_conf["name"])
+            )
+            payloads = (
+                in_conf["off_payload"].encode("utf8"),
+                in_conf["on_payload"].encode("utf8"),
+            )
+            in_conf["_publish_payloads"] = (
+                payloads[::-1] if in_conf["inverted"] else payloads
+            )
             self.digital_input_configs[in_conf["name"]] = in_conf
 
             gpio_module.setup_pin_internal(PinDirection.INPUT, in_conf)
@@ -394,10 +410,11 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
             if interrupt is None or (
                 interrupt_for and in_conf["poll_when_interrupt_for"]
             ):
-                self.transient_tasks.append(
+                add_transient_task(
+                    self.transient_tasks,
                     self.loop.create_task(
                         partial(self.digital_input_poller, gpio_module, in_conf)()
-                    )
+                    ),
                 )
 
             if interrupt:
@@ -423,19 +440,17 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
         # Set up MQTT publish callback for output event
         async def publish_callback(event: DigitalOutputChangedEvent) -> None:
             out_conf = self.digital_output_configs[event.output_name]
-            val = out_conf["on_payload"] if event.to_value else out_conf["off_payload"]
+            val: bytes = (
+                out_conf["_on_payload_bytes"]
+                if event.to_value
+                else out_conf["_off_payload_bytes"]
+            )
             self.mqtt_task_queue.put_nowait(
                 PriorityCoro(
                     self._mqtt_publish(
                         MQTTMessageSend(
-                            "/".join(
-                                (
-                                    self.config["mqtt"]["topic_prefix"],
-                                    "output",
-                                    event.output_name,
-                                )
-                            ),
-                            val.encode("utf8"),
+                            out_conf["_publish_topic"],
+                            val,
                             retain=out_conf["retain"],
                         )
                     ),
@@ -445,9 +460,16 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
 
         self.event_bus.subscribe(DigitalOutputChangedEvent, publish_callback)
 
+        sub_topics: List[str] = []
         for out_conf in self.config["digital_outputs"]:
             gpio_module = self.gpio_modules[out_conf["module"]]
             out_conf = validate_and_normalise_digital_output_config(out_conf, gpio_module)
+            # Precompute what we publish on every change of this output
+            out_conf["_publish_topic"] = "/".join(
+                (self.config["mqtt"]["topic_prefix"], OUTPUT_TOPIC, out_conf["name"])
+            )
+            out_conf["_on_payload_bytes"] = out_conf["on_payload"].encode("utf8")
+            out_conf["_off_payload_bytes"] = out_conf["off_payload"].encode("utf8")
             self.digital_output_configs[out_conf["name"]] = out_conf
 
             gpio_module.setup_pin_internal(PinDirection.OUTPUT, out_conf)
@@ -467,32 +489,33 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
                 self.loop.run_until_complete(create_digital_output_queue())
 
                 # Use partial to avoid late binding closure
-                self.transient_tasks.append(
+                add_transient_task(
+                    self.transient_tasks,
                     self.loop.create_task(
                         partial(
                             self.digital_output_loop,
                             gpio_module,
                             self.gpio_output_queues[out_conf["module"]],
                         )()
-                    )
+                    ),
                 )
 
-            # Add tasks to subscribe to outputs when MQTT is initialised
-            topics = []
-            for suffix in (SET_SUFFIX, SET_ON_MS_SUFFIX, SET_OFF_MS_SUFFIX):
-                topics.append(
-                    "/".join(
-                        (
-                            self.config["mqtt"]["topic_prefix"],
-                            OUTPUT_TOPIC,
-                            out_conf["name"],
-                            suffix,
-                        )
-                    )
-                )
-            self.mqtt_task_queue.put_nowait(
-                PriorityCoro(self._mqtt_subscribe(topics), MQTT_SUB_PRIORITY)
+            # Resolve everything each topic's messages need now, rather than per message
+            output_queue = self.gpio_output_queues[out_conf["module"]]
+            handle_ms_msg = partial(
+                self._handle_digital_output_ms_msg, gpio_module, out_conf
             )
+            handlers: Dict[str, Callable[[bytes], Coroutine[Any, Any, None]]] = {
+                SET_SUFFIX: partial(
+                    self._handle_digital_output_set_msg, output_queue, out_conf
+                ),
+                SET_ON_MS_SUFFIX: partial(handle_ms_msg, True),
+                SET_OFF_MS_SUFFIX: partial(handle_ms_msg, False),
+            }
+            for suffix, handler in handlers.items():
+                topic = "/".join((out_conf["_publish_topic"], suffix))
+                sub_topics.append(topic)
+                self._mqtt_topic_handlers[topic] = handler
 
             # Fire DigitalOutputChangedEvents for initial values of outputs if required
             if out_conf["publish_initial"]:
@@ -515,6 +538,12 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
                 )
                 self.event_bus.fire(DigitalOutputChangedEvent(out_conf["name"], value))
 
+        # Subscribe to all of the outputs' topics at once when MQTT is initialised
+        if sub_topics:
+            self.mqtt_task_queue.put_nowait(
+                PriorityCoro(self._mqtt_subscribe(sub_topics), MQTT_SUB_PRIORITY)
+            )
+
     def _init_sensor_inputs(self) -> None:
         async def publish_sensor_callback(event: SensorReadEvent) -> None:
             sens_conf = self.sensor_input_configs[event.sensor_name]
@@ -523,14 +552,9 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
                 PriorityCoro(
                     self._mqtt_publish(
                         MQTTMessageSend(
-                            "/".join(
-                                (
-                                    self.config["mqtt"]["topic_prefix"],
-                                    SENSOR_TOPIC,
-                                    event.sensor_name,
-                                )
-                            ),
-                            f"{event.value:.{digits}f}".encode("utf8"),
+                            sens_conf["_publish_topic"],
+                            # Formatted numbers are always ASCII
+                            f"{event.value:.{digits}f}".encode("ascii"),
                             retain=sens_conf["retain"],
                         )
                     ),
@@ -545,6 +569,9 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
             sens_conf = validate_and_normalise_sensor_input_config(
                 sens_conf, sensor_module
             )
+            sens_conf["_publish_topic"] = "/".join(
+                (self.config["mqtt"]["topic_prefix"], SENSOR_TOPIC, sens_conf["name"])
+            )
             self.sensor_input_configs[sens_conf["name"]] = sens_conf
 
             sensor_module.setup_sensor(sens_conf)
@@ -566,28 +593,30 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
                 ) -> SensorValueType:
                     return await sensor_module.async_get_value(sens_conf)
 
+                # Look these up once, rather than on every poll
+                name: str = sens_conf["name"]
+                digits: int = sens_conf["digits"]
+                interval: int = sens_conf["interval"]
+                fire = self.event_bus.fire
+
                 while True:
                     value = None
                     try:
                         value = await get_sensor_value()
                     except Exception:  # pylint: disable=broad-except
                         _LOG.exception(
-                            "Exception when retrieving value from sensor %r:",
-                            sens_conf["name"],
+                            "Exception when retrieving value from sensor %r:", name
                         )
                     if value is not None:
-                        value = round(value, sens_conf["digits"])
-                        _LOG.info(
-                            "Read sensor '%s' value of %s", sens_conf["name"], value
-                        )
-                        self.event_bus.fire(SensorReadEvent(sens_conf["name"], value))
-                    await asyncio.sleep(sens_conf["interval"])
+                        value = round(value, digits)
+                        _LOG.info("Read sensor '%s' value of %s", name, value)
+                        fire(SensorReadEvent(name, value))
+                    await asyncio.sleep(interval)
 
-            self.transient_tasks.append(self.loop.create_task(poll_sensor()))
+            add_transient_task(self.transient_tasks, self.loop.create_task(poll_sensor()))
 
     async def _connect_mqtt(self) -> None:
         config: ConfigType = self.config["mqtt"]
-        topic_prefix: str = config["topic_prefix"]
         self.mqtt = AbstractMQTTClient.get_implementation(config["client_module"])(
             self.mqtt_client_options
         )
@@ -600,8 +629,8 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
             PriorityCoro(
                 self._mqtt_publish(
                     MQTTMessageSend(
-                        "/".join((topic_prefix, config["status_topic"])),
-                        config["status_payload_running"].encode("utf8"),
+                        self._status_topic,
+                        self._status_payload_running,
                         qos=1,
                         retain=True,
                     )
@@ -636,10 +665,35 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
                     sens_conf, mqtt_config, self.mqtt_client_options
                 )
             )
-        for msg in messages:
-            self.mqtt_task_queue.put_nowait(
-                PriorityCoro(self._mqtt_publish(msg), MQTT_ANNOUNCE_PRIORITY)
+        if not messages:
+            return
+
+        async def publish_all() -> None:
+            """
+            Each announcement goes to its own topic, so the order they arrive in doesn't
+            matter and we can wait on the broker for all of them at once. Every publish
+            is finished before this returns, even if some of them fail.
+            """
+            results = await asyncio.gather(
+                *(self._mqtt_publish(msg) for msg in messages), return_exceptions=True
             )
+            mqtt_exc: Optional[MQTTException] = None
+            for msg, result in zip(messages, results):
+                if isinstance(result, MQTTException):
+                    mqtt_exc = mqtt_exc or result
+                elif isinstance(result, Exception):
+                    _LOG.error(
+                        "Exception while publishing announcement to %r: %s",
+                        msg.topic,
+                        result,
+                    )
+            # Let the MQTT task loop see connection errors, so that we reconnect
+            if mqtt_exc is not None:
+                raise mqtt_exc
+
+        self.mqtt_task_queue.put_nowait(
+            PriorityCoro(publish_all(), MQTT_ANNOUNCE_PRIORITY)
+        )
 
     async def _mqtt_subscribe(self, topics: List[str]) -> None:
         """
@@ -664,20 +718,24 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
         if self.mqtt is None:
             raise RuntimeError("MQTT client was None when trying to publish.")
 
-        if msg.payload is None:
-            _LOG.debug("Publishing MQTT message on topic %r with no payload", msg.topic)
-        else:
-            try:
-                payload_str = msg.payload.decode("utf8")
-            except UnicodeDecodeError:
+        # Don't decode the payload just to throw it away if we're not logging it
+        if _LOG.isEnabledFor(logging.DEBUG):
+            if msg.payload is None:
                 _LOG.debug(
-                    "Publishing MQTT message on topic %r with non-unicode payload",
-                    msg.topic,
+                    "Publishing MQTT message on topic %r with no payload", msg.topic
                 )
             else:
-                _LOG.debug(
-                    "Publishing MQTT message on topic %r: %r", msg.topic, payload_str
-                )
+                try:
+                    payload_str = msg.payload.decode("utf8")
+                except UnicodeDecodeError:
+                    _LOG.debug(
+                        "Publishing MQTT message on topic %r with non-unicode payload",
+                        msg.topic,
+                    )
+                else:
+                    _LOG.debug(
+                        "Publishing MQTT message on topic %r: %r", msg.topic, payload_str
+                    )
 
         await self.mqtt.publish(msg)
 
@@ -852,7 +910,8 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
         # Does the interrupt_for module say that its interrupt pin will be held low
         # until the interrupt register is read, or does it just pulse its interrupt
         # pin?
-        _LOG.debug("Interrupt is for pins: '%s'", "', '".join(pin_names))
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("Interrupt is for pins: '%s'", "', '".join(pin_names))
         remote_modules_and_pins: Dict[GenericGPIO, List[PinType]] = {}
         for remote_pin_name in pin_names:
             in_conf = self.digital_input_configs[remote_pin_name]
@@ -901,110 +960,91 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
         Parse all MQTT messages received on our subscriptions and dispatch actions
         such as changing outputs and sending data to streams accordingly.
         """
-
-        if not any(
-            topic.endswith(f"/{x}")
-            for x in (SET_SUFFIX, SET_ON_MS_SUFFIX, SET_OFF_MS_SUFFIX, SEND_SUFFIX)
-        ):
+        handler = self._mqtt_topic_handlers.get(topic)
+        if handler is None:
+            # We shouldn't get here, because we only subscribe to topics we know.
             _LOG.debug(
-                "Ignoring message to topic '%s' which doesn't end with a known suffix",
-                topic,
+                "Ignoring message to topic '%s' which we have no handler for", topic
             )
             return
+        await handler(payload)
 
-        # Handle digital output message
-        if any(
-            topic.endswith(f"/{x}")
-            for x in (SET_SUFFIX, SET_ON_MS_SUFFIX, SET_OFF_MS_SUFFIX)
-        ):
-            try:
-                payload_str = payload.decode("utf8")
-            except UnicodeDecodeError:
-                _LOG.warning(
-                    "Received MQTT message to a digital output topic '%s' that wasn't unicode.",
-                    topic,
-                )
-                return
-            await self._handle_digital_output_msg(topic, payload_str)
-
-        # Handle stream send message
-        if topic.endswith("/send"):
-            await self._handle_stream_send_msg(topic, payload)
+    @staticmethod
+    def _decode_digital_output_payload(
+        out_conf: ConfigType, payload: bytes
+    ) -> Optional[str]:
+        try:
+            return payload.decode("utf8")
+        except UnicodeDecodeError:
+            _LOG.warning(
+                "Received MQTT message to digital output '%s' that wasn't unicode.",
+                out_conf["name"],
+            )
+            return None
 
-        # Ignore unknown topics, although we shouldn't get here, because we only subscribe
-        # to ones we know.
+    async def _handle_digital_output_set_msg(
+        self,
+        queue: "asyncio.Queue[Tuple[ConfigType, str]]",
+        out_conf: ConfigType,
+        payload_bytes: bytes,
+    ) -> None:
+        """
+        Handle an MQTT message that intends to set a digital output to a given value.
+        """
+        payload = self._decode_digital_output_payload(out_conf, payload_bytes)
+        if payload is not None:
+            queue.put_nowait((out_conf, payload))
 
-    async def _handle_digital_output_msg(self, topic: str, payload: str) -> None:
+    async def _handle_digital_output_ms_msg(
+        self,
+        module: GenericGPIO,
+        out_conf: ConfigType,
+        desired_value: bool,
+        payload_bytes: bytes,
+    ) -> None:
         """
-        Handle an MQTT message that intends to set a digital output's state.
+        Handle an MQTT message that intends to set a digital output to a given value for
+        a number of milliseconds (set_on_ms or set_off_ms).
         """
-        topic_prefix: str = self.config["mqtt"]["topic_prefix"]
-        try:
-            output_name = output_name_from_topic(topic, topic_prefix, OUTPUT_TOPIC)
-        except ValueError as exc:
-            _LOG.warning("Unable to parse digital output name from topic: %s", exc)
+        payload = self._decode_digital_output_payload(out_conf, payload_bytes)
+        if payload is None:
             return
+        # Work out everything up front, so we don't start a task for a bad payload
         try:
-            out_conf = self.digital_output_configs[output_name]
-        except KeyError:
-            _LOG.warning("No digital output config found named %r", output_name)
+            secs = float(payload) / 1000
+        except ValueError:
+            _LOG.warning("Unable to parse ms value as float from payload %r", payload)
             return
-        try:
-            module = self.gpio_modules[out_conf["module"]]
-        except KeyError:
-            _LOG.warning("No GPIO module config found named %r", out_conf["module"])
-            return
-        if topic.endswith("/%s" % SET_SUFFIX):
-            # This is a message to set a digital output to a given value
-            self.gpio_output_queues[out_conf["module"]].put_nowait((out_conf, payload))
-        else:
-            # This must be a set_on_ms or set_off_ms topic
-            desired_value = topic.endswith("/%s" % SET_ON_MS_SUFFIX)
+        name = out_conf["name"]
+        desired_str, reset_str = ("on", "off") if desired_value else ("off", "on")
 
-            async def set_ms() -> None:
-                """
-                Create this task to directly set the outputs, as we don't want to tie up
-                the set_digital_output loop. Creating a bespoke task for the job is the
-                simplest and most effective way of leveraging the asyncio framework.
-                """
-                try:
-                    secs = float(payload) / 1000
-                except ValueError:
-                    _LOG.warning(
-                        "Unable to parse ms value as float from payload %r", payload
-                    )
-                    return
-                _LOG.info(
-                    "Turning output '%s' %s for %s second(s)",
-                    out_conf["name"],
-                    "on" if desired_value else "off",
-                    secs,
-                )
-                await self.set_digital_output(module, out_conf, desired_value)
-                await asyncio.sleep(secs)
-                _LOG.info(
-                    "Turning output '%s' %s after %s second(s) elapsed",
-                    out_conf["name"],
-                    "off" if desired_value else "on",
-                    secs,
-                )
-                await self.set_digital_output(module, out_conf, not desired_value)
+        async def set_ms() -> None:
+            """
+            Create this task to directly set the outputs, as we don't want to tie up
+            the set_digital_output loop. Creating a bespoke task for the job is the
+            simplest and most effective way of leveraging the asyncio framework.
+            """
+            _LOG.info("Turning output '%s' %s for %s second(s)", name, desired_str, secs)
+            await self.set_digital_output(module, out_conf, desired_value)
+            await asyncio.sleep(secs)
+            _LOG.info(
+                "Turning output '%s' %s after %s second(s) elapsed",
+                name,
+                reset_str,
+                secs,
+            )
+            await self.set_digital_output(module, out_conf, not desired_value)
 
-            task = self.loop.create_task(set_ms())
-            self.transient_tasks.append(task)
+        task = self.loop.create_task(set_ms())
+        add_transient_task(self.transient_tasks, task)
 
-    async def _handle_stream_send_msg(self, topic: str, payload: bytes) -> None:
-        try:
-            stream_name = output_name_from_topic(
-                topic, self.config["mqtt"]["topic_prefix"], STREAM_TOPIC
-            )
-        except ValueError as exc:
-            _LOG.warning("Unable to parse stream name from topic: %s", exc)
-            return
-        try:
-            self.stream_output_queues[stream_name].put_nowait(payload)
-        except KeyError:
-            _LOG.warning("No stream output queue found named %r", stream_name)
+    async def _handle_stream_send_msg(
+        self, queue: "asyncio.Queue[bytes]", payload: bytes
+    ) -> None:
+        """
+        Handle an MQTT message containing data to send to a stream.
+        """
+        queue.put_nowait(payload)
 
     async def set_digital_output(
         self, module: GenericGPIO, output_config: ConfigType, value: bool
@@ -1013,15 +1053,32 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
         Set a digital output, taking into account whether it's configured
         to be inverted.
         """
-        set_value = value != output_config["inverted"]
-        await module.async_set_pin(output_config["pin"], set_value)
-        _LOG.info(
-            "Digital output '%s' set to %s (%s)",
-            output_config["name"],
-            set_value,
-            "on" if value else "off",
-        )
-        self.event_bus.fire(DigitalOutputChangedEvent(output_config["name"], value))
+        await self.set_digital_outputs(module, [(output_config, value)])
+
+    async def set_digital_outputs(
+        self, module: GenericGPIO, outputs: List[Tuple[ConfigType, bool]]
+    ) -> None:
+        """
+        Set multiple digital outputs on the same module in one call to the module,
+        taking into account whether each is configured to be inverted.
+        """
+        pin_values: Dict[PinType, bool] = {
+            out_conf["pin"]: value != out_conf["inverted"] for out_conf, value in outputs
+        }
+        if len(pin_values) == 1:
+            # Leave single pins to the module's own set_pin implementation
+            ((pin, set_value),) = pin_values.items()
+            await module.async_set_pin(pin, set_value)
+        else:
+            await module.async_set_pins(pin_values)
+        for out_conf, value in outputs:
+            _LOG.info(
+                "Digital output '%s' set to %s (%s)",
+                out_conf["name"],
+                pin_values[out_conf["pin"]],
+                "on" if value else "off",
+            )
+            self.event_bus.fire(DigitalOutputChangedEvent(out_conf["name"], value))
 
     # Tasks
 
@@ -1057,7 +1114,6 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
           will trigger the exception if the connection was lost and reconnect. (Issue #282)
         """
         config: ConfigType = self.config["mqtt"]
-        topic_prefix: str = config["topic_prefix"]
         if not self.mqtt_connected.is_set():
             _LOG.debug("_mqtt_keep_alive_loop awaiting MQTT connection")
             await self.mqtt_connected.wait()
@@ -1068,12 +1124,14 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
                 while self.mqtt is None:
                     await asyncio.sleep(1)
                 continue
-            await self.mqtt.publish(MQTTMessageSend(
-                        "/".join((topic_prefix, config["status_topic"])),
-                        config["status_payload_running"].encode("utf8"),
-                        qos=1,
-                        retain=True,
-                    ))
+            await self.mqtt.publish(
+                MQTTMessageSend(
+                    self._status_topic,
+                    self._status_payload_running,
+                    qos=1,
+                    retain=True,
+                )
+            )
             await asyncio.sleep(config["keepalive"])
 
     async def _mqtt_rx_loop(self) -> None:
@@ -1081,43 +1139,28 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
             _LOG.debug("_mqtt_rx_loop awaiting MQTT connection")
             await self.mqtt_connected.wait()
             _LOG.debug("_mqtt_rx_loop unblocked after MQTT connection")
+        if self.mqtt is None:
+            _LOG.error("Attempted to get MQTT message before client initialised")
+            while self.mqtt is None:
+                await asyncio.sleep(1)
+        # Look these up once, rather than for every message received
+        get_msg = self.mqtt.message_queue.get
+        handle_msg = self._handle_mqtt_msg
         while True:
-            if self.mqtt is None:
-                _LOG.error("Attempted to get MQTT message before client initialised")
-                while self.mqtt is None:
-                    await asyncio.sleep(1)
-                continue
-            msg = await self.mqtt.message_queue.get()
+            msg = await get_msg()
             if msg.payload is None:
                 _LOG.warning(
                     "Received a message to topic '%r' without a payload", msg.topic
                 )
                 continue
-            try:
-                payload_str = msg.payload.decode("utf8")
-            except UnicodeDecodeError:
-                _LOG.debug("Received non-unicode message on topic %r", msg.topic)
-            else:
-                _LOG.debug("Received message on topic %r: %r", msg.topic, payload_str)
-            await self._handle_mqtt_msg(msg.topic, msg.payload)
-
-    async def _remove_finished_transient_tasks(self) -> None:
-        while True:
-            await asyncio.sleep(1)
-            finished_tasks = [x for x in self.transient_tasks if x.done()]
-            if not finished_tasks:
-                continue
-            for task in finished_tasks:
-                self.transient_tasks.remove(task)
-            results = await asyncio.gather(*finished_tasks, return_exceptions=True)
-            for i, exception in [
-                x for x in enumerate(results) if isinstance(x[1], Exception)
-            ]:
-                task = finished_tasks[i]
+            if _LOG.isEnabledFor(logging.DEBUG):
                 try:
-                    raise exception
-                except Exception:  # pylint: disable=broad-except
-                    _LOG.exception("Exception in task: %r:", task)
+                    payload_str = msg.payload.decode("utf8")
+                except UnicodeDecodeError:
+                    _LOG.debug("Received non-unicode message on topic %r", msg.topic)
+                else:
+                    _LOG.debug("Received message on topic %r: %r", msg.topic, payload_str)
+            await handle_msg(msg.topic, msg.payload)
 
     async def digital_output_loop(
         self, module: GenericGPIO, queue: "asyncio.Queue[Tuple[ConfigType, str]]"
@@ -1131,44 +1174,76 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
         It may seem like we should use this loop to handle /set_on_ms and /set_off_ms
         messages, but it's actually better that we don't, since any timed stuff would
         hold up /set messages that need to take place immediately.
+
+        Any messages which have queued up while we were busy are handled together, so
+        that the module can set all of their pins in one go. If the same pin is set more
+        than once, the values are applied in separate batches so that none are skipped.
         """
+        get_item = queue.get
+        get_item_nowait = queue.get_nowait
         while True:
-            out_conf, payload = await queue.get()
-            if payload not in (out_conf["on_payload"], out_conf["off_payload"]):
-                _LOG.warning(
-                    "'%s' is not a valid payload for output %s. Only '%s' and '%s' are allowed.",
-                    payload,
-                    out_conf["name"],
-                    out_conf["on_payload"],
-                    out_conf["off_payload"],
-                )
-                continue
-
-            value = payload == out_conf["on_payload"]
-            await self.set_digital_output(module, out_conf, value)
+            items = [await get_item()]
+            while True:
+                try:
+                    items.append(get_item_nowait())
+                except QueueEmpty:
+                    break
 
-            try:
-                msec = out_conf["timed_set_ms"]
-            except KeyError:
-                continue
+            batches: List[Dict[PinType, Tuple[ConfigType, bool]]] = [{}]
+            for out_conf, payload in items:
+                if payload not in (out_conf["on_payload"], out_conf["off_payload"]):
+                    _LOG.warning(
+                        (
+                            "'%s' is not a valid payload for output %s. "
+                            "Only '%s' and '%s' are allowed."
+                        ),
+                        payload,
+                        out_conf["name"],
+                        out_conf["on_payload"],
+                        out_conf["off_payload"],
+                    )
+                    continue
+                if out_conf["pin"] in batches[-1]:
+                    batches.append({})
+                value = payload == out_conf["on_payload"]
+                batches[-1][out_conf["pin"]] = (out_conf, value)
+
+            for batch in batches:
+                if not batch:
+                    continue
+                await self.set_digital_outputs(module, list(batch.values()))
+                for out_conf, value in batch.values():
+                    self._start_timed_set_reset(module, out_conf, value)
+
+    def _start_timed_set_reset(
+        self, module: GenericGPIO, out_conf: ConfigType, value: bool
+    ) -> None:
+        """
+        If the output is configured with 'timed_set_ms', start a task to set it back to
+        the opposite value once that time has elapsed.
+        """
+        try:
+            msec = out_conf["timed_set_ms"]
+        except KeyError:
+            return
 
-            async def reset_timer(out_conf: ConfigType = out_conf) -> None:
-                """
-                Reset the output to the opposite value after x ms.
-                """
-                await asyncio.sleep(msec / 1000.0)
-                _LOG.info(
-                    (
-                        "Setting digital output '%s' back to its previous value after "
-                        "configured 'timed_set_ms' delay of %sms"
-                    ),
-                    out_conf["name"],
-                    msec,
-                )
-                await self.set_digital_output(module, out_conf, not value)
+        async def reset_timer() -> None:
+            """
+            Reset the output to the opposite value after x ms.
+            """
+            await asyncio.sleep(msec / 1000.0)
+            _LOG.info(
+                (
+                    "Setting digital output '%s' back to its previous value after "
+                    "configured 'timed_set_ms' delay of %sms"
+                ),
+                out_conf["name"],
+                msec,
+            )
+            await self.set_digital_output(module, out_conf, not value)
 
-            task = self.loop.create_task(reset_timer())
-            self.transient_tasks.append(task)
+        task = self.loop.create_task(reset_timer())
+        add_transient_task(self.transient_tasks, task)
 
     async def stream_output_loop(
         self,
@@ -1178,17 +1253,25 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
     ) -> None:
         """
         Wait for data to appear on the queue, then send it to the stream.
+
+        Any data which has queued up while we were busy writing is sent in one write.
         """
         while True:
-            data = await queue.get()
+            chunks = [await queue.get()]
+            while True:
+                try:
+                    chunks.append(queue.get_nowait())
+                except QueueEmpty:
+                    break
             try:
-                await module.async_write(data)
+                await module.async_write(b"".join(chunks))
             except Exception:  # pylint: disable=broad-except
                 _LOG.exception(
                     "Exception while sending data to stream '%s':", stream_conf["name"]
                 )
             else:
-                self.event_bus.fire(StreamDataSentEvent(stream_conf["name"], data))
+                for data in chunks:
+                    self.event_bus.fire(StreamDataSentEvent(stream_conf["name"], data))
 
     async def _main_loop(self) -> None:
         reconnect = True
@@ -1205,7 +1288,6 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
                         self._mqtt_task_loop(),
                         self._mqtt_rx_loop(),
                         self._mqtt_keep_alive_loop(),
-                        self._remove_finished_transient_tasks(),
                     )
                 ]
 
@@ -1255,6 +1337,7 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
         Main entry point into the server which initialises all of the modules, connects to
         MQTT and starts the event loop.
         """
+        asyncio.set_event_loop(self.loop)
 
         for sig in (signals.SIGHUP, signals.SIGTERM, signals.SIGINT):
 
@@ -1266,6 +1349,13 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
 
             self.loop.add_signal_handler(sig, signal_handler)
 
+        # Python 3.12+: let short-lived tasks (MQTT publish callbacks, set_ms etc.) run
+        # synchronously up to their first blocking await instead of waiting a loop cycle.
+        if hasattr(asyncio, "eager_task_factory"):
+            self.loop.set_task_factory(
+                asyncio.eager_task_factory  # type: ignore[attr-defined]
+            )
+
         self._init_gpio_modules()
         self._init_digital_inputs()
         self._init_digital_outputs()
@@ -1298,18 +1388,25 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
         """
         Shut down all of the tasks involved in running the server.
         """
-        # Cancel our tasks
-        our_tasks: List["asyncio.Task[Any]"] = self.critical_tasks + self.transient_tasks
-        for task in our_tasks:
-            task.cancel()
-
         _LOG.info("Waiting for our tasks to complete...")
-        results = await asyncio.gather(*our_tasks, return_exceptions=True)
-        for i, result in enumerate(results):
+
+        # Cancel the critical tasks first, so they don't create any more transient tasks
+        for task in self.critical_tasks:
+            task.cancel()
+        results = await asyncio.gather(*self.critical_tasks, return_exceptions=True)
+        for task, result in zip(self.critical_tasks, results):
             if isinstance(result, asyncio.CancelledError):
                 continue
             if isinstance(result, Exception):
-                _LOG.error("Task %s raised an exception: %s", results[i], result)
+                _LOG.error("Task %s raised an exception: %s", task, result)
+
+        # Transient tasks remove themselves from the set (logging any exceptions) when
+        # they're done. Keep going until it's empty, in case any were added meanwhile.
+        while self.transient_tasks:
+            transient_tasks = list(self.transient_tasks)
+            for task in transient_tasks:
+                task.cancel()
+            await asyncio.gather(*transient_tasks, return_exceptions=True)
 
         # Close any remaining unscheduled mqtt coroutines
         while True:
@@ -1322,13 +1419,8 @@ class MqttIo:  # pylint: disable=too-many-instance-attributes
         if self.mqtt is not None:
             await self._mqtt_publish(
                 MQTTMessageSend(
-                    "/".join(
-                        (
-                            self.config["mqtt"]["topic_prefix"],
-                            self.config["mqtt"]["status_topic"],
-                        )
-                    ),
-                    self.config["mqtt"]["status_payload_stopped"].encode("utf8"),
+                    self._status_topic,
+                    self._status_payload_stopped,
                     qos=1,
                     retain=True,
                 ),
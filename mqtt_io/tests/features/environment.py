@@ -10,10 +10,12 @@ def before_scenario(context: Any, scenario: Any) -> None:
     Initialise data.
     """
     context.loop = asyncio.new_event_loop()
+    # Make it the current loop too, for async steps which don't look up context.loop
+    asyncio.set_event_loop(context.loop)
     context.data = dict(
         raw_config={},
         loop=context.loop,
-        transient_tasks=[],
+        transient_tasks=set(),
         event_subs={},
         mocks={},
     )
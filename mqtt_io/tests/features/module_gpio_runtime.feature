@@ -249,3 +249,89 @@ Feature: GPIO module runtime
             """
             payload: "ON"
             """
+
+    Scenario: Queued digital output messages are set in order, one batch per repeated pin
+        Given a valid config
+        And the config has an entry in gpio_modules with
+            """
+            name: mock
+            module: mock
+            """
+        And the config has an entry in digital_outputs with
+            """
+            name: mock0
+            module: mock
+            pin: 0
+            """
+        And the config has an entry in digital_outputs with
+            """
+            name: mock1
+            module: mock
+            pin: 1
+            """
+        When we validate the main config
+        And we instantiate MqttIo
+        And we initialise GPIO modules
+        And we mock _mqtt_publish on MqttIo
+        And we initialise digital outputs
+        And we subscribe to DigitalOutputChangedEvent
+        And we queue digital output payloads
+            """
+            - [mock0, "ON"]
+            - [mock1, "ON"]
+            - [mock1, "bogus"]
+            - [mock0, "OFF"]
+            """
+        Then GPIO module mock should have set pins in order
+            """
+            - [0, true]
+            - [1, true]
+            - [0, false]
+            """
+        And DigitalOutputChangedEvent events are fired in order with
+            """
+            - output_name: mock0
+              to_value: true
+            - output_name: mock1
+              to_value: true
+            - output_name: mock0
+              to_value: false
+            """
+
+    Scenario: Queued digital output message with timed_set_ms is set back afterwards
+        Given a valid config
+        And the config has an entry in gpio_modules with
+            """
+            name: mock
+            module: mock
+            """
+        And the config has an entry in digital_outputs with
+            """
+            name: mock0
+            module: mock
+            pin: 0
+            inverted: yes
+            timed_set_ms: 10
+            """
+        When we validate the main config
+        And we instantiate MqttIo
+        And we initialise GPIO modules
+        And we mock _mqtt_publish on MqttIo
+        And we initialise digital outputs
+        And we subscribe to DigitalOutputChangedEvent
+        And we queue digital output payloads
+            """
+            - [mock0, "ON"]
+            """
+        Then GPIO module mock should have set pins in order
+            """
+            - [0, false]
+            - [0, true]
+            """
+        And DigitalOutputChangedEvent events are fired in order with
+            """
+            - output_name: mock0
+              to_value: true
+            - output_name: mock0
+              to_value: false
+            """
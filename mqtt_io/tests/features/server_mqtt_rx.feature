@@ -0,0 +1,131 @@
+Feature: Routing of received MQTT messages
+    Scenario: Digital output set message is sent to the module's output queue
+        Given a valid config
+        And the mqtt config section dict contains
+            """
+            topic_prefix: my/home/io
+            """
+        And the config has an entry in gpio_modules with
+            """
+            name: mock
+            module: mock
+            """
+        And the config has an entry in digital_outputs with
+            """
+            name: mock0
+            module: mock
+            pin: 0
+            """
+        When we validate the main config
+        And we instantiate MqttIo
+        And we initialise GPIO modules
+        And we mock _mqtt_publish on MqttIo
+        And we initialise digital outputs
+        And we receive an MQTT message on my/home/io/output/mock0/set with payload ON
+        Then GPIO module mock should have set pins in order
+            """
+            - [0, true]
+            """
+
+    Scenario: Digital output set_on_ms message starts a tracked transient task
+        Given a valid config
+        And the mqtt config section dict contains
+            """
+            topic_prefix: my/home/io
+            """
+        And the config has an entry in gpio_modules with
+            """
+            name: mock
+            module: mock
+            """
+        And the config has an entry in digital_outputs with
+            """
+            name: mock0
+            module: mock
+            pin: 0
+            """
+        When we validate the main config
+        And we instantiate MqttIo
+        And we initialise GPIO modules
+        And we mock _mqtt_publish on MqttIo
+        And we initialise digital outputs
+        And we receive an MQTT message on my/home/io/output/mock0/set_on_ms with payload 1000
+        Then a transient task running set_ms is tracked
+
+    Scenario: Digital output set_on_ms message with a bad payload doesn't start a task
+        Given a valid config
+        And the mqtt config section dict contains
+            """
+            topic_prefix: my/home/io
+            """
+        And the config has an entry in gpio_modules with
+            """
+            name: mock
+            module: mock
+            """
+        And the config has an entry in digital_outputs with
+            """
+            name: mock0
+            module: mock
+            pin: 0
+            """
+        When we validate the main config
+        And we instantiate MqttIo
+        And we initialise GPIO modules
+        And we mock _mqtt_publish on MqttIo
+        And we initialise digital outputs
+        And we receive an MQTT message on my/home/io/output/mock0/set_on_ms with payload soon
+        Then a transient task running set_ms isn't tracked
+
+    Scenario: Stream send message is sent to the stream's output queue
+        Given a valid config
+        And the mqtt config section dict contains
+            """
+            topic_prefix: my/home/io
+            """
+        And the config has an entry in stream_modules with
+            """
+            name: mockstream
+            module: mock
+            """
+        When we validate the main config
+        And we instantiate MqttIo
+        And we mock _mqtt_publish on MqttIo
+        And we initialise stream modules
+        And we receive an MQTT message on my/home/io/stream/mockstream/send with payload hello
+        Then stream module mockstream should have written
+            """
+            - hello
+            """
+
+    Scenario: Messages on topics we have no handler for are ignored
+        Given a valid config
+        And the mqtt config section dict contains
+            """
+            topic_prefix: my/home/io
+            """
+        And the config has an entry in gpio_modules with
+            """
+            name: mock
+            module: mock
+            """
+        And the config has an entry in digital_outputs with
+            """
+            name: mock0
+            module: mock
+            pin: 0
+            """
+        When we validate the main config
+        And we instantiate MqttIo
+        And we initialise GPIO modules
+        And we mock _mqtt_publish on MqttIo
+        And we initialise digital outputs
+        And we receive an MQTT message on my/home/io/output/mock0/bogus with payload ON
+        And we receive an MQTT message on my/home/io/output/mock0 with payload ON
+        And we receive an MQTT message on home/io/output/mock0/set with payload ON
+        And we receive an MQTT message on my/home/io/output/mock1/set with payload ON
+        And we receive an MQTT message on my/home/io/output/mock0/set with payload OFF
+        Then GPIO module mock should have set pins in order
+            """
+            - [0, false]
+            """
@@ -0,0 +1,16 @@
+Feature: Tracking of the server's transient tasks
+    Scenario: Transient task is no longer tracked once it has finished
+        Given a valid config
+        When we validate the main config
+        And we instantiate MqttIo
+        And we add a transient task which returns
+        Then the transient task should no longer be tracked
+        And the transient task's exception isn't logged
+
+    Scenario: Transient task which raises is logged and no longer tracked
+        Given a valid config
+        When we validate the main config
+        And we instantiate MqttIo
+        And we add a transient task which raises
+        Then the transient task should no longer be tracked
+        And the transient task's exception is logged
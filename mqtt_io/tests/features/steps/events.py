@@ -68,3 +68,23 @@ def step(context: Any, event_type_name: str) -> None:
     event = mock_sub.call_args.args[0]
     for key, value in data.items():
         assert getattr(event, key) == value, f"Expecting event.{key} to be {value}"
+
+
+@then("{event_type_name} events are fired in order with")  # type: ignore[no-redef]
+@async_run_until_complete(loop="loop")
+async def step(context: Any, event_type_name: str) -> None:
+    data = yaml.safe_load(context.text)
+    assert isinstance(data, list), "Data provided to this step must be a YAML list"
+    mock_sub = context.data["event_subs"][event_type_name]
+    # Listeners are called from tasks, so give them a chance to run
+    for _ in range(100):
+        if mock_sub.call_count >= len(data):
+            break
+        await asyncio.sleep(0.01)
+    events_fired = [call_args.args[0] for call_args in mock_sub.call_args_list]
+    assert len(events_fired) == len(
+        data
+    ), f"Expecting {len(data)} events but {len(events_fired)} were fired"
+    for event, expected in zip(events_fired, data):
+        for key, value in expected.items():
+            assert getattr(event, key) == value, f"Expecting event.{key} to be {value}"
@@ -1,6 +1,7 @@
 import asyncio
 from typing import Any
 
+import yaml
 from behave import given, then, when  # type: ignore
 from behave.api.async_step import async_run_until_complete  # type: ignore
 from mqtt_io.modules.gpio import InterruptEdge, PinDirection
@@ -150,6 +151,17 @@ def step(context: Any, is_isnt: str, module_name: str):
         ), "Shouldn't have a digital output loop task added to the event loop"
 
 
+@then("a transient task running {coro_name} {is_isnt} tracked")  # type: ignore[no-redef]
+def step(context: Any, coro_name: str, is_isnt: str) -> None:
+    assert is_isnt in ("is", "isn't")
+    mqttio: MqttIo = context.data["mqttio"]
+    coro_names = {get_coro(task).__name__ for task in mqttio.transient_tasks}
+    if is_isnt == "is":
+        assert coro_name in coro_names, f"Should have a {coro_name} task tracked"
+    else:
+        assert coro_name not in coro_names, f"Shouldn't have a {coro_name} task tracked"
+
+
 @then("{pin_name} {should_shouldnt} be configured as a remote interrupt")  # type: ignore[no-redef]
 def step(context: Any, pin_name: str, should_shouldnt: str):
     assert should_shouldnt in ("should", "shouldn't")
@@ -193,3 +205,29 @@ async def step(context: Any, pin_name: str, on_off: str) -> None:
     out_conf = mqttio.digital_output_configs[pin_name]
     module = mqttio.gpio_modules[out_conf["module"]]
     await mqttio.set_digital_output(module, out_conf, on_off == "on")
+
+
+@when("we queue digital output payloads")  # type: ignore[no-redef]
+def step(context: Any) -> None:
+    data = yaml.safe_load(context.text)
+    assert isinstance(data, list), "Data provided to this step must be a YAML list"
+    mqttio: MqttIo = context.data["mqttio"]
+    for pin_name, payload in data:
+        out_conf = mqttio.digital_output_configs[pin_name]
+        mqttio.gpio_output_queues[out_conf["module"]].put_nowait((out_conf, payload))
+
+
+@then("GPIO module {module_name} should have set pins in order")  # type: ignore[no-redef]
+@async_run_until_complete(loop="loop")
+async def step(context: Any, module_name: str) -> None:
+    data = yaml.safe_load(context.text)
+    assert isinstance(data, list), "Data provided to this step must be a YAML list"
+    mqttio = context.data["mqttio"]
+    set_pin = mqttio.gpio_modules[module_name].set_pin
+    # Give the digital output loop (and the module's executor) time to get there
+    for _ in range(100):
+        if set_pin.call_count >= len(data):
+            break
+        await asyncio.sleep(0.01)
+    calls = [list(args) for args, _ in set_pin.call_args_list]
+    assert calls == data, f"Pins were set with {calls} but we were expecting {data}"
@@ -1,6 +1,7 @@
 import asyncio
+import logging
 from inspect import iscoroutinefunction
-from typing import Any, Union
+from typing import Any, List, Union
 from unittest.mock import Mock
 
 import yaml
@@ -9,13 +10,27 @@ from behave.api.async_step import async_run_until_complete  # type: ignore
 from mqtt_io.exceptions import ConfigValidationFailed
 from mqtt_io.mqtt import MQTTMessage, MQTTMessageSend
 from mqtt_io.server import MqttIo
+from mqtt_io.utils import add_transient_task
 
 try:
     from unittest.mock import AsyncMock  # type: ignore[attr-defined]
 except ImportError:
     from mock import AsyncMock  # type: ignore[attr-defined]
 
-# pylint: disable=function-redefined
+# pylint: disable=function-redefined,protected-access
+
+
+class MockLoggingHandler(logging.Handler):
+    """
+    Logging handler which keeps the records it's given, so that they can be checked.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
 
 
 @when("we instantiate MqttIo")  # type: ignore[no-redef]
@@ -158,3 +173,74 @@ def step(context: Any, module_name: str, should_shouldnt: str) -> None:
     )
 
     assert test if should_shouldnt == "should" else not test
+
+
+@when("we receive an MQTT message on {topic} with payload {payload}")  # type: ignore[no-redef]
+@async_run_until_complete(loop="loop")
+async def step(context: Any, topic: str, payload: str) -> None:
+    mqttio: MqttIo = context.data["mqttio"]
+    await mqttio._handle_mqtt_msg(topic, payload.encode("utf8"))
+
+
+@then("stream module {module_name} should have written")  # type: ignore[no-redef]
+@async_run_until_complete(loop="loop")
+async def step(context: Any, module_name: str) -> None:
+    data = yaml.safe_load(context.text)
+    assert isinstance(data, list), "Data provided to this step must be a YAML list"
+    mqttio: MqttIo = context.data["mqttio"]
+    write = mqttio.stream_modules[module_name].write
+    # Give the stream output loop (and the module's executor) time to get there
+    for _ in range(100):
+        if write.call_count >= len(data):
+            break
+        await asyncio.sleep(0.01)
+    written = [args[0].decode("utf8") for args, _ in write.call_args_list]
+    assert written == data, f"Stream wrote {written} but we were expecting {data}"
+
+
+@when("we add a transient task which {returns_raises}")  # type: ignore[no-redef]
+def step(context: Any, returns_raises: str) -> None:
+    assert returns_raises in ("returns", "raises")
+    mqttio: MqttIo = context.data["mqttio"]
+
+    # Capture what the task done callback logs
+    handler = MockLoggingHandler()
+    logging.getLogger("mqtt_io.utils").addHandler(handler)
+    context.add_cleanup(logging.getLogger("mqtt_io.utils").removeHandler, handler)
+    context.data["log_records"] = handler.records
+
+    async def transient_task() -> None:
+        if returns_raises == "raises":
+            raise ValueError("Transient task failed")
+
+    task = mqttio.loop.create_task(transient_task())
+    add_transient_task(mqttio.transient_tasks, task)
+    context.data["transient_task"] = task
+
+
+@then("the transient task should no longer be tracked")  # type: ignore[no-redef]
+@async_run_until_complete(loop="loop")
+async def step(context: Any) -> None:
+    mqttio: MqttIo = context.data["mqttio"]
+    task = context.data["transient_task"]
+    # Let the task run and its done callback be called
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert task.done(), "Task should have finished"
+    assert task not in mqttio.transient_tasks, "Task shouldn't be in transient_tasks"
+
+
+@then("the transient task's exception {is_isnt} logged")  # type: ignore[no-redef]
+def step(context: Any, is_isnt: str) -> None:
+    assert is_isnt in ("is", "isn't")
+    logged_excs = [
+        record.exc_info[1]
+        for record in context.data["log_records"]
+        if record.levelno == logging.ERROR and record.exc_info
+    ]
+    if is_isnt == "is":
+        assert any(
+            isinstance(exc, ValueError) for exc in logged_excs
+        ), "The task's exception should have been logged"
+    else:
+        assert not logged_excs, "No exception should have been logged"
@@ -2,7 +2,11 @@
 Utils for MQTT IO project.
 """
 import asyncio
-from typing import Any, Coroutine, List, Optional, cast
+import logging
+from functools import partial
+from typing import Any, Coroutine, Optional, Set, cast
+
+_LOG = logging.getLogger(__name__)
 
 
 class PriorityCoro:
@@ -21,9 +25,31 @@ class PriorityCoro:
         return cast(bool, self.priority == other.priority)
 
 
+def _transient_task_done(
+    transient_tasks: Set["asyncio.Task[Any]"], task: "asyncio.Task[Any]"
+) -> None:
+    transient_tasks.discard(task)
+    if task.cancelled():
+        return
+    exception = task.exception()
+    if exception is not None:
+        _LOG.error("Exception in task: %r:", task, exc_info=exception)
+
+
+def add_transient_task(
+    transient_tasks: Set["asyncio.Task[Any]"], task: "asyncio.Task[Any]"
+) -> None:
+    """
+    Add the Task to transient_tasks, and have it removed again (logging any exception it
+    raised) as soon as it's done.
+    """
+    transient_tasks.add(task)
+    task.add_done_callback(partial(_transient_task_done, transient_tasks))
+
+
 def create_unawaited_task_threadsafe(
     loop: asyncio.AbstractEventLoop,
-    transient_tasks: List["asyncio.Task[Any]"],
+    transient_tasks: Set["asyncio.Task[Any]"],
     coro: Coroutine[Any, Any, None],
     task_future: Optional["asyncio.Future[asyncio.Task[Any]]"] = None,
 ) -> None:
@@ -33,7 +59,7 @@ def create_unawaited_task_threadsafe(
 
     def callback() -> None:
         task = loop.create_task(coro)
-        transient_tasks.append(task)
+        add_transient_task(transient_tasks, task)
         if task_future is not None:
             task_future.set_result(task)
 